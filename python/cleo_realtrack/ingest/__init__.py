@@ -3,32 +3,46 @@
 from .login import RealTrackSession
 from .search_nav import (
     DEFAULT_SEARCH_CONFIG,
+    ResultsPage,
     SearchConfig,
+    fetch_results_page,
     open_saved_search,
+    parse_results_page,
     prepare_saved_search,
 )
-from .extract_links import extract_detail_links, ensure_absolute
+from .extract_links import extract_detail_links, extract_detail_skip, ensure_absolute
 from .extract_rt_id import extract_rt_id
 from .integrity_checks import (
     verify_html_vs_state,
     verify_total_count_bounds,
     verify_known_rt_encounter,
+    verify_detail_position,
 )
-from .search_page import extract_total_count
+from .search_page import extract_current_page, extract_items_per_page, extract_total_count
 from .assets import download_transaction_assets
+from .asset_postprocess import process_asset_manifests, watch_asset_manifests
 
 __all__ = [
     "RealTrackSession",
     "open_saved_search",
     "prepare_saved_search",
+    "fetch_results_page",
+    "parse_results_page",
+    "ResultsPage",
     "SearchConfig",
     "DEFAULT_SEARCH_CONFIG",
     "ensure_absolute",
     "extract_detail_links",
+    "extract_detail_skip",
     "extract_rt_id",
     "verify_html_vs_state",
     "verify_total_count_bounds",
     "verify_known_rt_encounter",
+    "verify_detail_position",
+    "extract_current_page",
+    "extract_items_per_page",
     "extract_total_count",
     "download_transaction_assets",
+    "process_asset_manifests",
+    "watch_asset_manifests",
 ]
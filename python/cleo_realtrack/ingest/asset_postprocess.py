@@ -0,0 +1,261 @@
+"""Post-process downloaded RealTrack assets into dashboard-ready derivatives."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from .assets import load_manifest, write_manifest
+
+logger = logging.getLogger(__name__)
+
+DERIVED_DIRNAME = "derived"
+THUMBNAIL_SIZE = (320, 320)
+PDF_MAGIC = b"%PDF"
+
+
+@dataclass
+class PostprocessResult:
+    """Outcome of one post-processing pass over a set of manifests."""
+
+    updated: int = 0
+    written: list[Path] = field(default_factory=list)
+    failed: list[Path] = field(default_factory=list)
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sniff_kind(path: Path) -> Optional[str]:
+    """Classify an asset by its contents; filenames may be ``.bin`` or lack a suffix."""
+
+    from PIL import Image, UnidentifiedImageError
+
+    with path.open("rb") as handle:
+        if handle.read(len(PDF_MAGIC)) == PDF_MAGIC:
+            return "pdf"
+    try:
+        with Image.open(path):
+            return "image"
+    except UnidentifiedImageError:
+        return None
+
+
+def _derive_image(asset_path: Path, derived_dir: Path) -> dict[str, Any]:
+    from PIL import Image
+
+    thumb_name = f"{asset_path.name}.thumb.jpg"
+    with Image.open(asset_path) as image:
+        metadata = {
+            "width": image.width,
+            "height": image.height,
+            "format": image.format,
+            "mode": image.mode,
+        }
+        thumb = image.convert("RGB")
+        thumb.thumbnail(THUMBNAIL_SIZE)
+        thumb.save(derived_dir / thumb_name, "JPEG", quality=85)
+    return {
+        "thumbnail": f"{DERIVED_DIRNAME}/{thumb_name}",
+        "image": metadata,
+    }
+
+
+def _derive_pdf(asset_path: Path, derived_dir: Path) -> dict[str, Any]:
+    from pypdf import PdfReader
+
+    text_name = f"{asset_path.name}.txt"
+    reader = PdfReader(asset_path)
+    text = "\n\n".join(page.extract_text() or "" for page in reader.pages)
+    (derived_dir / text_name).write_text(text, encoding="utf-8", errors="replace")
+    return {
+        "text": f"{DERIVED_DIRNAME}/{text_name}",
+        "pages": len(reader.pages),
+    }
+
+
+def derive_asset(
+    asset_path: str,
+    derived_dir: str,
+    known_digest: Optional[str] = None,
+) -> tuple[str, Optional[dict[str, Any]]]:
+    """Hash one asset and build its derivatives unless the digest was already processed.
+
+    Runs inside a worker process, so arguments and results stay picklable. Returns the
+    content digest and the derivative metadata, or ``None`` when ``known_digest`` matches.
+    I/O errors on the asset itself propagate so the caller can retry on a later pass.
+    """
+
+    path = Path(asset_path)
+    digest = file_sha256(path)
+    if digest == known_digest:
+        return digest, None
+
+    out_dir = Path(derived_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        kind = _sniff_kind(path)
+        if kind == "image":
+            derivatives = _derive_image(path, out_dir)
+        elif kind == "pdf":
+            derivatives = _derive_pdf(path, out_dir)
+        else:
+            derivatives = {}
+    except Exception as exc:  # corrupt or unsupported files should not stall the pool
+        kind = None
+        derivatives = {"error": f"{type(exc).__name__}: {exc}"}
+    derivatives["kind"] = kind
+    derivatives["processed"] = True
+    return digest, derivatives
+
+
+def process_asset_manifests(
+    manifest_paths: Iterable[Path], executor: Executor
+) -> PostprocessResult:
+    """Fan out derivative work for every asset in the given manifests.
+
+    Assets whose size and mtime match the values recorded with their derivatives are
+    not resubmitted; otherwise the worker re-hashes and only rebuilds derivatives when
+    the digest changed, refreshing the recorded size and mtime either way.
+    Failures are isolated per asset and per manifest: a manifest with a failed asset is
+    reported in ``failed`` so the watcher retries it, and other manifests are still written.
+    Results go through ``write_manifest``, which merges by filename with whatever is on
+    disk. ``BrokenProcessPool`` propagates so the caller can rebuild the executor.
+    """
+
+    result = PostprocessResult()
+    failed: set[Path] = set()
+    futures = []
+    for manifest_path in manifest_paths:
+        asset_dir = manifest_path.parent
+        try:
+            records = load_manifest(manifest_path)
+        except (OSError, ValueError, TypeError) as exc:
+            # Not retried until the manifest changes again.
+            logger.warning("Skipping unreadable manifest %s: %s", manifest_path, exc)
+            continue
+        for record in records:
+            try:
+                asset_stat = (asset_dir / record.filename).stat()
+            except FileNotFoundError:
+                continue
+            size, mtime_ns = asset_stat.st_size, asset_stat.st_mtime_ns
+            if record.derivatives and (record.size, record.mtime_ns) == (size, mtime_ns):
+                continue
+            known_digest = record.sha256 if record.derivatives else None
+            future = executor.submit(
+                derive_asset,
+                str(asset_dir / record.filename),
+                str(asset_dir / DERIVED_DIRNAME),
+                known_digest,
+            )
+            futures.append((manifest_path, record.filename, size, mtime_ns, future))
+
+    updates: dict[Path, dict[str, tuple[str, int, int, Optional[dict[str, Any]]]]] = {}
+    for manifest_path, filename, size, mtime_ns, future in futures:
+        try:
+            digest, derivatives = future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception as exc:
+            logger.warning(
+                "Post-processing failed for %s/%s: %s", manifest_path.parent, filename, exc
+            )
+            failed.add(manifest_path)
+            continue
+        updates.setdefault(manifest_path, {})[filename] = (digest, size, mtime_ns, derivatives)
+
+    for manifest_path, results in updates.items():
+        if not manifest_path.parent.is_dir():
+            continue
+        try:
+            records = load_manifest(manifest_path)
+            updated = 0
+            for record in records:
+                if record.filename not in results:
+                    continue
+                record.sha256, record.size, record.mtime_ns, derivatives = results[
+                    record.filename
+                ]
+                if derivatives is not None:
+                    record.derivatives = derivatives
+                    updated += 1
+            write_manifest(manifest_path, manifest_path.parent.name, records)
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("Could not update manifest %s: %s", manifest_path, exc)
+            failed.add(manifest_path)
+            continue
+        result.updated += updated
+        result.written.append(manifest_path)
+
+    result.failed = sorted(failed)
+    return result
+
+
+def watch_asset_manifests(
+    assets_root: Path,
+    *,
+    interval: float = 30.0,
+    max_workers: Optional[int] = None,
+    on_pass: Optional[Callable[[PostprocessResult], None]] = None,
+) -> None:
+    """Poll ``RT*/manifest.json`` files and post-process any that changed.
+
+    ``on_pass`` receives the result of every pass that touched a manifest. An
+    ``interval`` of zero or less performs a single pass and returns.
+    """
+
+    seen_mtimes: dict[Path, int] = {}
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            changed: list[Path] = []
+            for manifest_path in sorted(assets_root.glob("RT*/manifest.json")):
+                try:
+                    mtime = manifest_path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    seen_mtimes.pop(manifest_path, None)
+                    continue
+                if seen_mtimes.get(manifest_path) != mtime:
+                    seen_mtimes[manifest_path] = mtime
+                    changed.append(manifest_path)
+
+            if changed:
+                try:
+                    result = process_asset_manifests(changed, executor)
+                except BrokenProcessPool as exc:
+                    logger.warning("Worker pool crashed; restarting: %s", exc)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                    for manifest_path in changed:
+                        seen_mtimes.pop(manifest_path, None)
+                else:
+                    # Record our own writes so the next scan does not re-hash them.
+                    for manifest_path in result.written:
+                        try:
+                            seen_mtimes[manifest_path] = manifest_path.stat().st_mtime_ns
+                        except FileNotFoundError:
+                            seen_mtimes.pop(manifest_path, None)
+                    for manifest_path in result.failed:
+                        seen_mtimes.pop(manifest_path, None)
+                    if on_pass is not None:
+                        on_pass(result)
+
+            if interval <= 0:
+                return
+            time.sleep(interval)
+    finally:
+        executor.shutdown()
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import stat
+import tempfile
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Iterable, List, Optional
 from urllib.parse import urlparse
 import re
 
@@ -19,6 +22,69 @@ WINDOW_OPEN_RE = re.compile(r"window\.open\(\s*['\"]([^'\"]+)['\"]")
 class AssetRecord:
     filename: str
     source_url: str
+    sha256: Optional[str] = None
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    derivatives: dict[str, Any] = field(default_factory=dict)
+
+
+def load_manifest(manifest_path: Path) -> list[AssetRecord]:
+    """Read the asset records stored in an RT manifest, if present."""
+
+    if not manifest_path.exists():
+        return []
+    data = json.loads(manifest_path.read_text())
+    return [AssetRecord(**item) for item in data.get("assets", [])]
+
+
+def _manifest_mode(manifest_path: Path) -> int:
+    try:
+        return stat.S_IMODE(manifest_path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_manifest(
+    manifest_path: Path, rt_id: str, records: Iterable[AssetRecord]
+) -> list[AssetRecord]:
+    """Merge records into the on-disk manifest by filename and atomically replace it.
+
+    Hashes and derivatives already on disk are kept for records that lack them, and
+    on-disk records missing from ``records`` are retained, so the ingest run and the
+    post-processing watcher do not drop each other's updates. Returns the merged list.
+    """
+
+    merged = list(records)
+    by_filename = {record.filename: record for record in merged}
+    for existing in load_manifest(manifest_path):
+        record = by_filename.get(existing.filename)
+        if record is None:
+            merged.append(existing)
+        elif record.sha256 is None and existing.sha256 is not None:
+            record.sha256 = existing.sha256
+            record.size = existing.size
+            record.mtime_ns = existing.mtime_ns
+            record.derivatives = existing.derivatives
+
+    payload = {
+        "rt_id": rt_id,
+        "assets": [asdict(record) for record in merged],
+    }
+    fd, tmp_name = tempfile.mkstemp(
+        dir=manifest_path.parent, prefix=f"{manifest_path.name}.", suffix=".tmp"
+    )
+    try:
+        # mkstemp creates 0600 files; keep the manifest readable like write_text would.
+        os.fchmod(fd, _manifest_mode(manifest_path))
+        with os.fdopen(fd, "w") as handle:
+            handle.write(json.dumps(payload, indent=2))
+        os.replace(tmp_name, manifest_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return merged
 
 
 def extract_asset_urls(html: str) -> List[str]:
@@ -107,11 +173,7 @@ async def download_transaction_assets(
     asset_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = asset_dir / "manifest.json"
 
-    manifest: list[AssetRecord] = []
-    if manifest_path.exists():
-        data = json.loads(manifest_path.read_text())
-        for item in data.get("assets", []):
-            manifest.append(AssetRecord(**item))
+    manifest = load_manifest(manifest_path)
 
     existing_sources = {record.source_url for record in manifest}
 
@@ -128,9 +190,4 @@ async def download_transaction_assets(
         manifest.append(record)
         existing_sources.add(absolute_url)
 
-    manifest_payload = {
-        "rt_id": rt_id,
-        "assets": [record.__dict__ for record in manifest],
-    }
-    manifest_path.write_text(json.dumps(manifest_payload, indent=2))
-    return manifest
+    return write_manifest(manifest_path, rt_id, manifest)
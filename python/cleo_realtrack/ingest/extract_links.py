@@ -6,6 +6,7 @@ import re
 from typing import Iterable, List
 
 DETAIL_LINK_RE = re.compile(r'href="([^"]*?page=details[^"]*)"')
+DETAIL_SKIP_RE = re.compile(r"[?&]skip=(\d+)")
 
 
 def extract_detail_links(html: str) -> List[str]:
@@ -22,6 +23,15 @@ def extract_detail_links(html: str) -> List[str]:
     return ordered
 
 
+def extract_detail_skip(link: str) -> int:
+    """Return the ``skip`` offset addressed by a detail link."""
+
+    match = DETAIL_SKIP_RE.search(link)
+    if not match:
+        raise ValueError(f"Detail link has no skip offset: {link}")
+    return int(match.group(1))
+
+
 def ensure_absolute(base_url: str, links: Iterable[str]) -> List[str]:
     """Prefix relative links with the RealTrack base URL."""
 
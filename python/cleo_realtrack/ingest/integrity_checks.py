@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Iterable, Set
 
+DETAIL_POSITION_RE = re.compile(r"(\d+)\s*/\s*(\d+)(?:&nbsp;|\s)*RT\d{5,}")
+
 
 def verify_html_vs_state(html_dir: Path, seen_rt_ids: Iterable[str]) -> None:
     """Ensure there is a one-to-one relationship between files and seen IDs."""
@@ -37,3 +40,20 @@ def verify_known_rt_encounter(found_known: bool) -> None:
         raise RuntimeError(
             "Ordering invariant broken: expected to find known RT by skip<=3"
         )
+
+
+def verify_detail_position(detail_html: str, skip: int) -> None:
+    """Ensure a detail page is row ``skip`` of the search, per its "K / total" footer.
+
+    Guards against ``page=details&skip=N`` resolving relative to whichever results
+    page the session loaded last, e.g. while the next page is being prefetched.
+    """
+
+    match = DETAIL_POSITION_RE.search(detail_html)
+    if not match:
+        raise RuntimeError("Unable to locate result position on detail page")
+    position = int(match.group(1))
+    if position != skip + 1:
+        raise RuntimeError(
+            f"Detail page for skip={skip} reports position {position}; search state drifted"
+        )
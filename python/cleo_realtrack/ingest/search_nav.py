@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+from .extract_links import ensure_absolute, extract_detail_links, extract_detail_skip
+from .search_page import extract_current_page, extract_items_per_page
 
 if TYPE_CHECKING:  # pragma: no cover
     from .login import RealTrackSession
@@ -35,6 +38,15 @@ class SearchConfig:
 DEFAULT_SEARCH_CONFIG = SearchConfig()
 
 
+@dataclass
+class ResultsPage:
+    """A parsed RealTrack results page with absolute detail links."""
+
+    page_index: int
+    html: str
+    links: List[str] = field(default_factory=list)
+
+
 async def prepare_saved_search(
     session: "RealTrackSession", config: SearchConfig = DEFAULT_SEARCH_CONFIG
 ) -> str:
@@ -67,9 +79,66 @@ async def prepare_saved_search(
     return await page.content()
 
 
+def _results_path(page_index: int) -> str:
+    delimiter = "&" if "?" in RESULTS_PATH else "?"
+    return f"{RESULTS_PATH}{delimiter}tabID={page_index}"
+
+
 async def open_saved_search(session: "RealTrackSession", *, page_index: int = 0) -> str:
     """Navigate to a RealTrack results page applying the provided page index."""
 
-    delimiter = "&" if "?" in RESULTS_PATH else "?"
-    path = f"{RESULTS_PATH}{delimiter}tabID={page_index}"
-    return await session.goto(path)
+    return await session.goto(_results_path(page_index))
+
+
+def parse_results_page(
+    session: "RealTrackSession", page_index: int, html: str
+) -> ResultsPage:
+    """Build a ``ResultsPage`` from results HTML, checking RealTrack served the requested page.
+
+    Detail links must be consecutive ``skip`` offsets starting at
+    ``page_index * items_per_page``; anything else means offsets are page-relative
+    and the links would resolve against whichever page the session loaded last.
+    """
+
+    rendered_index = extract_current_page(html)
+    if rendered_index != page_index:
+        raise RuntimeError(
+            f"Requested results page {page_index} but RealTrack rendered page {rendered_index}"
+        )
+    links = extract_detail_links(html)
+    first_skip = page_index * extract_items_per_page(html)
+    skips = [extract_detail_skip(link) for link in links]
+    if skips != list(range(first_skip, first_skip + len(skips))):
+        raise RuntimeError(
+            f"Results page {page_index} detail offsets do not start at skip={first_skip}"
+        )
+    return ResultsPage(
+        page_index=page_index,
+        html=html,
+        links=ensure_absolute(session.base_url, links),
+    )
+
+
+async def fetch_results_page(session: "RealTrackSession", page_index: int) -> ResultsPage:
+    """Load a results page in a transient tab, leaving ``session.search_page`` untouched.
+
+    RealTrack keeps the submitted search server-side per session, so ``tabID`` paging
+    works from any tab once ``prepare_saved_search`` has run. Whether detail links stay
+    valid while another page loads is not assumed: ``parse_results_page`` rejects
+    page-relative offsets, and callers should check each detail page with
+    ``verify_detail_position`` before trusting it.
+
+    The page is considered loaded once ``#resultsTable`` renders rather than waiting
+    for ``networkidle``. Cancelling the awaiting task closes the tab.
+    """
+
+    page = await session.context.new_page()
+    try:
+        await page.goto(
+            session.build_url(_results_path(page_index)), wait_until="domcontentloaded"
+        )
+        await page.wait_for_selector("#resultsTable")
+        html = await page.content()
+    finally:
+        await page.close()
+    return parse_results_page(session, page_index, html)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 
 TOTAL_RE = re.compile(r"\.pagination\((\d+),")
+CURRENT_PAGE_RE = re.compile(r"current_page:\s*(\d+)")
+ITEMS_PER_PAGE_RE = re.compile(r"items_per_page:\s*(\d+)")
 
 
 def extract_total_count(html: str) -> int:
@@ -14,3 +16,21 @@ def extract_total_count(html: str) -> int:
     if not match:
         raise ValueError("Unable to locate total count on search page")
     return int(match.group(1))
+
+
+def extract_current_page(html: str) -> int:
+    """Return the zero-based page index RealTrack rendered in its pagination JS."""
+
+    match = CURRENT_PAGE_RE.search(html)
+    if not match:
+        raise ValueError("Unable to locate current page on search page")
+    return int(match.group(1))
+
+
+def extract_items_per_page(html: str) -> int:
+    """Return the page size RealTrack rendered in its pagination JS."""
+
+    match = ITEMS_PER_PAGE_RE.search(html)
+    if not match:
+        raise ValueError("Unable to locate page size on search page")
+    return int(match.group(1))
@@ -3,22 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
+import math
 import os
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 
 from dotenv import load_dotenv
 
 from cleo_realtrack.ingest import (
     RealTrackSession,
-    ensure_absolute,
-    extract_detail_links,
+    ResultsPage,
+    extract_detail_skip,
     extract_rt_id,
     extract_total_count,
+    fetch_results_page,
+    parse_results_page,
     prepare_saved_search,
-    open_saved_search,
     SearchConfig,
+    verify_detail_position,
     verify_html_vs_state,
     verify_known_rt_encounter,
     verify_total_count_bounds,
@@ -63,6 +67,14 @@ def build_search_config() -> SearchConfig:
     return SearchConfig(start_year=start_year, end_year=end_year_env or None)
 
 
+async def cancel_prefetch(task: Optional["asyncio.Task[ResultsPage]"]) -> None:
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+
+
 async def fetch_new_transactions() -> None:
     seen_ids = load_seen_ids()
     initial_seen_count = len(seen_ids)
@@ -91,39 +103,48 @@ async def fetch_new_transactions() -> None:
         await session.ensure_login()
 
         first_page_html = await prepare_saved_search(session, search_config)
+        total_count = extract_total_count(first_page_html)
+        verify_total_count_bounds(total_count, seen_ids)
+        results_page = parse_results_page(session, 0, first_page_html)
+        per_page = int(search_config.per_page)
+        page_limit = min(max_pages, math.ceil(total_count / per_page))
 
         for page_index in range(max_pages):
-            if page_index == 0:
-                search_html = first_page_html
-            else:
-                search_html = await open_saved_search(session, page_index=page_index)
-            if page_index == 0:
-                total_count = extract_total_count(search_html)
-                verify_total_count_bounds(total_count, seen_ids)
-            links = extract_detail_links(search_html)
-            absolute_links = ensure_absolute(session.base_url, links)
-
-            for detail_link in absolute_links:
-                detail_html = await session.fetch(detail_link)
-                rt_id = extract_rt_id(detail_html)
-
-                if rt_id in seen_ids:
-                    found_known = True
-                    break
-
-                save_detail_html(rt_id, detail_html)
-                seen_ids.add(rt_id)
-                new_rt_ids.append(rt_id)
-                await download_transaction_assets(
-                    session=session,
-                    rt_id=rt_id,
-                    html=detail_html,
-                    assets_root=RAW_ASSETS_DIR,
-                )
-
-            if found_known:
+            # Load page N+1 in its own tab while page N's details are processed; each
+            # detail's position is checked so a shifted search state fails the run.
+            prefetch: Optional["asyncio.Task[ResultsPage]"] = None
+            if page_index + 1 < page_limit and len(results_page.links) >= per_page:
+                prefetch = asyncio.create_task(fetch_results_page(session, page_index + 1))
+
+            try:
+                for detail_link in results_page.links:
+                    detail_html = await session.fetch(detail_link)
+                    verify_detail_position(detail_html, extract_detail_skip(detail_link))
+                    rt_id = extract_rt_id(detail_html)
+
+                    if rt_id in seen_ids:
+                        found_known = True
+                        break
+
+                    save_detail_html(rt_id, detail_html)
+                    seen_ids.add(rt_id)
+                    new_rt_ids.append(rt_id)
+                    await download_transaction_assets(
+                        session=session,
+                        rt_id=rt_id,
+                        html=detail_html,
+                        assets_root=RAW_ASSETS_DIR,
+                    )
+            except BaseException:
+                await cancel_prefetch(prefetch)
+                raise
+
+            if found_known or prefetch is None:
+                await cancel_prefetch(prefetch)
                 break
 
+            results_page = await prefetch
+
     if initial_seen_count > 0:
         verify_known_rt_encounter(found_known)
 
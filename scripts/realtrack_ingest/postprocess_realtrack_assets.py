@@ -0,0 +1,46 @@
+"""Command line entry point for post-processing downloaded RealTrack assets."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from cleo_realtrack.ingest.asset_postprocess import PostprocessResult, watch_asset_manifests
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = REPO_ROOT / "data"
+RAW_ASSETS_DIR = DATA_DIR / "raw_assets" / "realtrack"
+
+load_dotenv(REPO_ROOT / ".env")
+
+
+def report_pass(result: PostprocessResult) -> None:
+    if result.updated:
+        print(f"Post-processed {result.updated} RealTrack assets")
+    if result.failed:
+        print(f"Will retry {len(result.failed)} manifests with failed assets")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    interval = float(os.environ.get("REALTRACK_POSTPROCESS_INTERVAL") or "30")
+    workers_env = os.environ.get("REALTRACK_POSTPROCESS_WORKERS")
+    max_workers = int(workers_env) if workers_env else None
+    if max_workers is not None and max_workers < 1:
+        raise RuntimeError("REALTRACK_POSTPROCESS_WORKERS must be >= 1")
+
+    RAW_ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+    watch_asset_manifests(
+        RAW_ASSETS_DIR,
+        interval=interval,
+        max_workers=max_workers,
+        on_pass=report_pass,
+    )
+
+
+if __name__ == "__main__":
+    main()
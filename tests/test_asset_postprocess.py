@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from cleo_realtrack.ingest import asset_postprocess
+from cleo_realtrack.ingest.asset_postprocess import (
+    PostprocessResult,
+    derive_asset,
+    file_sha256,
+    process_asset_manifests,
+    watch_asset_manifests,
+)
+from cleo_realtrack.ingest.assets import AssetRecord, load_manifest, write_manifest
+
+
+def _write_photo(path: Path) -> None:
+    Image = pytest.importorskip("PIL.Image")
+    Image.new("RGB", (800, 600), "red").save(path, "JPEG")
+
+
+def test_derive_asset_skips_known_digest(tmp_path: Path) -> None:
+    asset = tmp_path / "photo.bin"
+    asset.write_bytes(b"not really a photo")
+
+    digest, derivatives = derive_asset(
+        str(asset), str(tmp_path / "derived"), file_sha256(asset)
+    )
+
+    assert digest == file_sha256(asset)
+    assert derivatives is None
+    assert not (tmp_path / "derived").exists()
+
+
+def test_derive_asset_detects_images_by_content(tmp_path: Path) -> None:
+    asset = tmp_path / "RT1_1.bin"
+    _write_photo(asset)
+
+    digest, derivatives = derive_asset(str(asset), str(tmp_path / "derived"))
+
+    assert digest == file_sha256(asset)
+    assert derivatives["kind"] == "image"
+    assert derivatives["image"]["width"] == 800
+    assert (tmp_path / derivatives["thumbnail"]).exists()
+
+
+def _make_rt(assets_root: Path, rt_id: str = "RT123456") -> Path:
+    rt_dir = assets_root / rt_id
+    rt_dir.mkdir(parents=True)
+    _write_photo(rt_dir / "air1.jpg")
+    manifest_path = rt_dir / "manifest.json"
+    write_manifest(
+        manifest_path,
+        rt_id,
+        [AssetRecord(filename="air1.jpg", source_url="https://example.com/air1.jpg")],
+    )
+    return manifest_path
+
+
+class StopWatch(Exception):
+    pass
+
+
+def _stop_after_passes(monkeypatch: pytest.MonkeyPatch, passes: int) -> None:
+    sleeps = []
+
+    def fake_sleep(_interval: float) -> None:
+        sleeps.append(_interval)
+        if len(sleeps) >= passes:
+            raise StopWatch
+
+    monkeypatch.setattr(asset_postprocess.time, "sleep", fake_sleep)
+
+
+def test_process_asset_manifests_records_and_then_skips(tmp_path: Path) -> None:
+    rt_dir = tmp_path / "RT123456"
+    rt_dir.mkdir()
+    _write_photo(rt_dir / "air1.jpg")
+    manifest_path = rt_dir / "manifest.json"
+    write_manifest(
+        manifest_path,
+        "RT123456",
+        [
+            AssetRecord(filename="air1.jpg", source_url="https://example.com/air1.jpg"),
+            AssetRecord(filename="missing.jpg", source_url="https://example.com/missing.jpg"),
+        ],
+    )
+
+    with ThreadPoolExecutor() as executor:
+        first = process_asset_manifests([manifest_path], executor)
+        second = process_asset_manifests([manifest_path], executor)
+
+    assert first.updated == 1
+    assert first.written == [manifest_path]
+    assert first.failed == []
+    record = load_manifest(manifest_path)[0]
+    assert record.sha256 == file_sha256(rt_dir / "air1.jpg")
+    assert record.derivatives["thumbnail"] == "derived/air1.jpg.thumb.jpg"
+    assert record.size == (rt_dir / "air1.jpg").stat().st_size
+    assert second.updated == 0
+    assert second.written == []
+
+
+def test_process_asset_manifests_rehashes_when_stat_changes(tmp_path: Path) -> None:
+    manifest_path = _make_rt(tmp_path)
+    asset = manifest_path.parent / "air1.jpg"
+
+    with ThreadPoolExecutor() as executor:
+        process_asset_manifests([manifest_path], executor)
+        before = load_manifest(manifest_path)[0]
+        asset.touch()
+        result = process_asset_manifests([manifest_path], executor)
+
+    after = load_manifest(manifest_path)[0]
+    assert result.updated == 0
+    assert result.written == [manifest_path]
+    assert after.derivatives == before.derivatives
+    assert after.mtime_ns == asset.stat().st_mtime_ns
+
+
+def test_watch_single_pass_reports_and_restart_skips(tmp_path: Path) -> None:
+    manifest_path = _make_rt(tmp_path)
+    passes: list[PostprocessResult] = []
+
+    watch_asset_manifests(tmp_path, interval=0, max_workers=1, on_pass=passes.append)
+    watch_asset_manifests(tmp_path, interval=0, max_workers=1, on_pass=passes.append)
+
+    assert [result.updated for result in passes] == [1, 0]
+    assert passes[0].written == [manifest_path]
+    assert passes[1].written == []
+
+
+def test_watch_does_not_revisit_its_own_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_rt(tmp_path)
+    passes: list[PostprocessResult] = []
+    _stop_after_passes(monkeypatch, 2)
+
+    with pytest.raises(StopWatch):
+        watch_asset_manifests(tmp_path, interval=1, max_workers=1, on_pass=passes.append)
+
+    assert [result.updated for result in passes] == [1]
+
+
+def test_watch_rebuilds_pool_and_retries_after_crash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_rt(tmp_path)
+    passes: list[PostprocessResult] = []
+    real_process = asset_postprocess.process_asset_manifests
+    calls = []
+
+    def crash_once(manifest_paths, executor):
+        calls.append(executor)
+        if len(calls) == 1:
+            raise BrokenProcessPool("worker died")
+        return real_process(manifest_paths, executor)
+
+    monkeypatch.setattr(asset_postprocess, "process_asset_manifests", crash_once)
+    _stop_after_passes(monkeypatch, 2)
+
+    with pytest.raises(StopWatch):
+        watch_asset_manifests(tmp_path, interval=1, max_workers=1, on_pass=passes.append)
+
+    assert len(calls) == 2
+    assert calls[0] is not calls[1]
+    assert [result.updated for result in passes] == [1]
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from cleo_realtrack.ingest.assets import AssetRecord, load_manifest, write_manifest
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    records = [
+        AssetRecord(filename="air1.jpg", source_url="https://example.com/air1.jpg"),
+        AssetRecord(
+            filename="doc.pdf",
+            source_url="https://example.com/doc.pdf",
+            sha256="abc",
+            derivatives={"kind": "pdf", "pages": 2},
+        ),
+    ]
+
+    write_manifest(manifest_path, "RT123456", records)
+
+    assert load_manifest(manifest_path) == records
+    assert list(tmp_path.iterdir()) == [manifest_path]
+
+
+def test_load_manifest_accepts_legacy_records(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        '{"rt_id": "RT1", "assets": [{"filename": "a.jpg", "source_url": "u"}]}'
+    )
+
+    assert load_manifest(manifest_path) == [AssetRecord(filename="a.jpg", source_url="u")]
+
+
+def test_write_manifest_keeps_derivatives_stored_by_watcher(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    stale = [AssetRecord(filename="a.jpg", source_url="a")]
+    write_manifest(
+        manifest_path,
+        "RT1",
+        [
+            AssetRecord(
+                filename="a.jpg", source_url="a", sha256="d1", derivatives={"kind": "image"}
+            ),
+            AssetRecord(filename="b.jpg", source_url="b"),
+        ],
+    )
+
+    merged = write_manifest(
+        manifest_path, "RT1", stale + [AssetRecord(filename="c.jpg", source_url="c")]
+    )
+
+    assert [record.filename for record in merged] == ["a.jpg", "c.jpg", "b.jpg"]
+    assert merged[0].sha256 == "d1"
+    assert merged[0].derivatives == {"kind": "image"}
+    assert load_manifest(manifest_path) == merged
+
+
+def test_write_manifest_keeps_default_file_mode(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    (tmp_path / "reference.json").write_text("{}")
+    expected = (tmp_path / "reference.json").stat().st_mode
+
+    write_manifest(manifest_path, "RT1", [AssetRecord(filename="a.jpg", source_url="a")])
+
+    assert manifest_path.stat().st_mode == expected
+
+
+def test_write_manifest_preserves_existing_mode(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    write_manifest(manifest_path, "RT1", [])
+    manifest_path.chmod(0o640)
+
+    write_manifest(manifest_path, "RT1", [AssetRecord(filename="a.jpg", source_url="a")])
+
+    assert manifest_path.stat().st_mode & 0o777 == 0o640
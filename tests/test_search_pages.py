@@ -0,0 +1,89 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from cleo_realtrack.ingest.extract_links import extract_detail_skip
+from cleo_realtrack.ingest.integrity_checks import verify_detail_position
+from cleo_realtrack.ingest.search_nav import parse_results_page
+from cleo_realtrack.ingest.search_page import extract_current_page, extract_total_count
+
+USER_DATA = Path(__file__).resolve().parents[1] / "user_data"
+RESULTS_HTML = (USER_DATA / "realtrack-search-results-page1.html").read_text()
+
+
+class FakeSession:
+    base_url = "https://www.realtrack.com"
+
+
+def test_extract_current_page() -> None:
+    assert extract_current_page(RESULTS_HTML) == 0
+    assert extract_current_page("items_per_page: 50,\ncurrent_page: 3,") == 3
+
+
+def test_extract_current_page_missing() -> None:
+    with pytest.raises(ValueError):
+        extract_current_page("<html></html>")
+
+
+def test_extract_total_count() -> None:
+    assert extract_total_count(RESULTS_HTML) == 15503
+
+
+def test_parse_results_page_builds_absolute_links() -> None:
+    page = parse_results_page(FakeSession(), 0, RESULTS_HTML)
+
+    assert page.page_index == 0
+    assert len(page.links) == 50
+    assert page.links[0] == "https://www.realtrack.com/?page=details&skip=0"
+    assert page.links[-1] == "https://www.realtrack.com/?page=details&skip=49"
+
+
+def test_parse_results_page_rejects_wrong_page() -> None:
+    with pytest.raises(RuntimeError, match="Requested results page 1"):
+        parse_results_page(FakeSession(), 1, RESULTS_HTML)
+
+
+def _as_page(page_index: int, skip_shift: int) -> str:
+    html = RESULTS_HTML.replace("current_page: 0", f"current_page: {page_index}")
+    return re.sub(
+        r"skip=(\d+)", lambda match: f"skip={int(match.group(1)) + skip_shift}", html
+    )
+
+
+def test_parse_results_page_accepts_result_set_offsets() -> None:
+    page = parse_results_page(FakeSession(), 1, _as_page(1, 50))
+
+    assert page.links[0].endswith("skip=50")
+    assert page.links[-1].endswith("skip=99")
+
+
+def test_parse_results_page_rejects_page_relative_offsets() -> None:
+    with pytest.raises(RuntimeError, match="do not start at skip=50"):
+        parse_results_page(FakeSession(), 1, _as_page(1, 0))
+
+
+def test_extract_detail_skip() -> None:
+    assert extract_detail_skip("https://www.realtrack.com/?page=details&skip=26") == 26
+    with pytest.raises(ValueError):
+        extract_detail_skip("?page=details")
+
+
+@pytest.mark.parametrize(
+    ("fixture", "skip"),
+    [("html-1.html", 25), ("html3.html", 77), ("realtrack-link-details-page.html", 0)],
+)
+def test_verify_detail_position_matches_skip(fixture: str, skip: int) -> None:
+    verify_detail_position((USER_DATA / fixture).read_text(), skip)
+
+
+def test_verify_detail_position_rejects_shifted_row() -> None:
+    html = (USER_DATA / "html-1.html").read_text()
+
+    with pytest.raises(RuntimeError, match="skip=75 reports position 26"):
+        verify_detail_position(html, 75)
+
+
+def test_verify_detail_position_requires_footer() -> None:
+    with pytest.raises(RuntimeError, match="Unable to locate result position"):
+        verify_detail_position("<html>RT123456</html>", 0)